@@ -17,8 +17,14 @@ import bpy
 
 
 def dump(obj, text):
-    for attr in dir(obj):
-        print("{!r}.{:s} = {:s}".format(obj, attr, getattr(obj, attr)))
+    # Only list RNA properties when available, `dir()` includes all methods & Python attributes.
+    if hasattr(obj, "bl_rna"):
+        attrs = [prop.identifier for prop in obj.bl_rna.properties]
+    else:
+        attrs = dir(obj)
+    for attr in attrs:
+        value = getattr(obj, attr)
+        print(f"{obj!r}.{attr} = {value!s}")
 
 
 class WM_OT_button_context_test(bpy.types.Operator):
@@ -31,17 +37,10 @@ class WM_OT_button_context_test(bpy.types.Operator):
         return context.active_object is not None
 
     def execute(self, context):
-        value = getattr(context, "button_pointer", None)
-        if value is not None:
-            dump(value, "button_pointer")
-
-        value = getattr(context, "button_prop", None)
-        if value is not None:
-            dump(value, "button_prop")
-
-        value = getattr(context, "button_operator", None)
-        if value is not None:
-            dump(value, "button_operator")
+        for attr in ("button_pointer", "button_prop", "button_operator"):
+            value = getattr(context, attr, None)
+            if value is not None:
+                dump(value, attr)
 
         return {'FINISHED'}
 
@@ -7,11 +7,14 @@ import bpy
 
 language_id = "shell"
 
+# Expand tabs in a single pass over the whole text (instead of per line).
+_TAB_TABLE = str.maketrans({"\t": "    "})
+
 
 def add_scrollback(text, text_type):
-    for l in text.split("\n"):
-        bpy.ops.console.scrollback_append(text=l.replace("\t", "    "),
-                                          type=text_type)
+    scrollback_append = bpy.ops.console.scrollback_append
+    for l in text.translate(_TAB_TABLE).split("\n"):
+        scrollback_append(text=l, type=text_type)
 
 
 def shell_run(text):
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import bpy
 from bpy.types import Operator
 from bpy.props import (
@@ -13,8 +15,14 @@ from bpy.props import (
 from bpy.app.translations import contexts as i18n_contexts
 
 
-def _lang_module_get(sc):
-    return __import__("console_" + sc.language,
+# Cache the `console_*` module for each `SpaceConsole.language`,
+# avoids importing the module each time a console operator runs.
+# NOTE: `sys.modules` isn't checked again once a module is cached, so a `console_*` module
+# which is removed and imported again (when reinstalling an extension for example)
+# is only picked up once scripts are reloaded.
+@lru_cache(maxsize=16)
+def _lang_module_get(language):
+    return __import__("console_" + language,
                       # for python 3.3, maybe a bug???
                       level=0)
 
@@ -36,7 +44,7 @@ class ConsoleExec(Operator):
     def execute(self, context):
         sc = context.space_data
 
-        module = _lang_module_get(sc)
+        module = _lang_module_get(sc.language)
         execute = getattr(module, "execute", None)
 
         if execute is not None:
@@ -58,7 +66,7 @@ class ConsoleAutocomplete(Operator):
 
     def execute(self, context):
         sc = context.space_data
-        module = _lang_module_get(sc)
+        module = _lang_module_get(sc.language)
         autocomplete = getattr(module, "autocomplete", None)
 
         if autocomplete:
@@ -80,7 +88,7 @@ class ConsoleCopyAsScript(Operator):
     def execute(self, context):
         sc = context.space_data
 
-        module = _lang_module_get(sc)
+        module = _lang_module_get(sc.language)
         copy_as_script = getattr(module, "copy_as_script", None)
 
         if copy_as_script:
@@ -102,17 +110,19 @@ class ConsoleBanner(Operator):
     def execute(self, context):
         sc = context.space_data
 
+        language = sc.language
+
         # default to python
-        if not sc.language:
-            sc.language = "python"
+        if not language:
+            language = sc.language = "python"
 
-        module = _lang_module_get(sc)
+        module = _lang_module_get(language)
         banner = getattr(module, "banner", None)
 
         if banner:
             return banner(context)
         else:
-            print("Error: bpy.ops.console.banner_%s - not found" % sc.language)
+            print("Error: bpy.ops.console.banner_%s - not found" % language)
             return {'FINISHED'}
 
 
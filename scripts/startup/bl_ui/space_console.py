@@ -31,28 +31,30 @@ class CONSOLE_MT_view(Menu):
 
     def draw(self, _context):
         layout = self.layout
+        operator = layout.operator
+        menu = layout.menu
 
-        props = layout.operator("wm.context_cycle_int", text="Zoom In")
+        props = operator("wm.context_cycle_int", text="Zoom In")
         props.data_path = "space_data.font_size"
         props.reverse = False
-        props = layout.operator("wm.context_cycle_int", text="Zoom Out")
+        props = operator("wm.context_cycle_int", text="Zoom Out")
         props.data_path = "space_data.font_size"
         props.reverse = True
 
         layout.separator()
 
-        layout.operator("console.move", text="Move to Previous Word").type = 'PREVIOUS_WORD'
-        layout.operator("console.move", text="Move to Next Word").type = 'NEXT_WORD'
-        layout.operator("console.move", text="Move to Line Begin").type = 'LINE_BEGIN'
-        layout.operator("console.move", text="Move to Line End").type = 'LINE_END'
+        operator("console.move", text="Move to Previous Word").type = 'PREVIOUS_WORD'
+        operator("console.move", text="Move to Next Word").type = 'NEXT_WORD'
+        operator("console.move", text="Move to Line Begin").type = 'LINE_BEGIN'
+        operator("console.move", text="Move to Line End").type = 'LINE_END'
 
         layout.separator()
 
-        layout.menu("CONSOLE_MT_language")
+        menu("CONSOLE_MT_language")
 
         layout.separator()
 
-        layout.menu("INFO_MT_area")
+        menu("INFO_MT_area")
 
 
 class CONSOLE_MT_language(Menu):
@@ -62,18 +64,18 @@ class CONSOLE_MT_language(Menu):
         import sys
 
         layout = self.layout
+        operator = layout.operator
         layout.column()
 
         # Collect modules with `console_*.execute`.
-        languages = []
-        for modname, mod in sys.modules.items():
-            if modname.startswith("console_") and hasattr(mod, "execute"):
-                languages.append(modname.split("_", 1)[-1])
-
-        languages.sort()
+        languages = sorted(
+            modname.split("_", 1)[-1]
+            for modname, mod in sys.modules.items()
+            if modname.startswith("console_") and getattr(mod, "execute", None) is not None
+        )
 
         for language in languages:
-            layout.operator("console.language", text=language.title(), translate=False).language = language
+            operator("console.language", text=language.title(), translate=False).language = language
 
 
 class CONSOLE_MT_console(Menu):
@@ -81,32 +83,33 @@ class CONSOLE_MT_console(Menu):
 
     def draw(self, _context):
         layout = self.layout
+        operator = layout.operator
 
-        layout.operator("console.clear")
-        layout.operator("console.clear_line")
-        layout.operator("console.delete", text="Delete Previous Word").type = 'PREVIOUS_WORD'
-        layout.operator("console.delete", text="Delete Next Word").type = 'NEXT_WORD'
+        operator("console.clear")
+        operator("console.clear_line")
+        operator("console.delete", text="Delete Previous Word").type = 'PREVIOUS_WORD'
+        operator("console.delete", text="Delete Next Word").type = 'NEXT_WORD'
 
         layout.separator()
 
-        layout.operator("console.copy_as_script", text="Copy as Script")
-        layout.operator("console.copy", text="Cut").delete = True
-        layout.operator("console.copy", text="Copy")
-        layout.operator("console.paste", text="Paste")
+        operator("console.copy_as_script", text="Copy as Script")
+        operator("console.copy", text="Cut").delete = True
+        operator("console.copy", text="Copy")
+        operator("console.paste", text="Paste")
 
         layout.separator()
 
-        layout.operator("console.indent")
-        layout.operator("console.unindent")
+        operator("console.indent")
+        operator("console.unindent")
 
         layout.separator()
 
-        layout.operator("console.history_cycle", text="Backward in History").reverse = True
-        layout.operator("console.history_cycle", text="Forward in History").reverse = False
+        operator("console.history_cycle", text="Backward in History").reverse = True
+        operator("console.history_cycle", text="Forward in History").reverse = False
 
         layout.separator()
 
-        layout.operator("console.autocomplete", text="Autocomplete")
+        operator("console.autocomplete", text="Autocomplete")
 
 
 class CONSOLE_MT_context_menu(Menu):
@@ -114,37 +117,40 @@ class CONSOLE_MT_context_menu(Menu):
 
     def draw(self, _context):
         layout = self.layout
+        operator = layout.operator
 
-        layout.operator("console.clear")
-        layout.operator("console.clear_line")
-        layout.operator("console.delete", text="Delete Previous Word").type = 'PREVIOUS_WORD'
-        layout.operator("console.delete", text="Delete Next Word").type = 'NEXT_WORD'
+        operator("console.clear")
+        operator("console.clear_line")
+        operator("console.delete", text="Delete Previous Word").type = 'PREVIOUS_WORD'
+        operator("console.delete", text="Delete Next Word").type = 'NEXT_WORD'
 
         layout.separator()
 
-        layout.operator("console.copy_as_script", text="Copy as Script")
-        layout.operator("console.copy", text="Cut").delete = True
-        layout.operator("console.copy", text="Copy")
-        layout.operator("console.paste", text="Paste")
+        operator("console.copy_as_script", text="Copy as Script")
+        operator("console.copy", text="Cut").delete = True
+        operator("console.copy", text="Copy")
+        operator("console.paste", text="Paste")
 
         layout.separator()
 
-        layout.operator("console.indent")
-        layout.operator("console.unindent")
+        operator("console.indent")
+        operator("console.unindent")
 
         layout.separator()
 
-        layout.operator("console.history_cycle", text="Backward in History").reverse = True
-        layout.operator("console.history_cycle", text="Forward in History").reverse = False
+        operator("console.history_cycle", text="Backward in History").reverse = True
+        operator("console.history_cycle", text="Forward in History").reverse = False
 
         layout.separator()
 
-        layout.operator("console.autocomplete", text="Autocomplete")
+        operator("console.autocomplete", text="Autocomplete")
 
 
 def add_scrollback(text, text_type):
-    for l in text.split("\n"):
-        bpy.ops.console.scrollback_append(text=l.expandtabs(4), type=text_type)
+    # Expand tabs for all lines at once, columns are reset at each line break.
+    scrollback_append = bpy.ops.console.scrollback_append
+    for l in text.expandtabs(4).split("\n"):
+        scrollback_append(text=l, type=text_type)
 
 
 classes = (